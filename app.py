@@ -21,6 +21,7 @@ import argparse
 
 import dash
 import diskcache
+import plotly.io as pio
 from dash import DiskcacheManager
 
 from demo_configs import APP_TITLE, THEME_COLOR, THEME_COLOR_SECONDARY
@@ -41,6 +42,10 @@ import multiprocess
 if multiprocess.get_start_method(allow_none=True) is None:
     multiprocess.set_start_method("spawn")
 
+# Dash serializes callback responses, including figures, with Plotly's JSON encoder. Use the
+# orjson engine so this happens in C rather than with the standard library json module.
+pio.json.config.default_engine = "orjson"
+
 cache = diskcache.Cache("./cache")
 background_callback_manager = DiskcacheManager(cache)
 
@@ -32,24 +32,40 @@ class DataSetBase:
         X (array): Feature data with features as columns.
         y (array): Target data.
         n (int): Number of features.
+        feature_names (tuple): Names of the features, in column order.
         baseline_cv_score (float):
             Baseline cross-validation score with all features.
         score_range (tuple):
             Lower and upper values for displaying cross-validation scores.
         default_redundancy_penalty (float)
         default_k (int): Default setting for number of features to select.
+        xaxis_title (str): Title of the feature axis when plotting the features.
     """
 
     def get_relevance(self):
-        """Return array of values for relevance of each feature to the target."""
-        return np.array([abs(np.corrcoef(x, self.y)[0, 1]) for x in self.X.values.T])
+        """Return float32 array of values for relevance of each feature to the target.
+
+        The array is only computed on the first call, later calls return the same array.
+        """
+        if getattr(self, "_relevance", None) is None:
+            self._relevance = np.array(
+                [abs(np.corrcoef(x, self.y)[0, 1]) for x in self.X.values.T], dtype=np.float32
+            )
+
+        return self._relevance
 
     def calc_redundancy(self):
-        """Compute and return 2d array of feature redundancy values."""
-        return abs(np.corrcoef(self.X.values, rowvar=False))
+        """Compute and return 2d float32 array of feature redundancy values."""
+        return abs(np.corrcoef(self.X.values, rowvar=False)).astype(np.float32)
 
     def get_redundancy(self):
-        """Return 2d array of feature redundancy values, possibly cached to disk."""
+        """Return 2d array of feature redundancy values, possibly cached to disk.
+
+        The array is only loaded or computed on the first call, later calls return the same array.
+        """
+        if getattr(self, "_redundancy", None) is not None:
+            return self._redundancy
+
         # The following logic can be used to store the redundancy matrix to disk
         # so that it does not need to be computed each time the app is launched.
         # This is probably not needed for dataset sizes that would be used with
@@ -57,16 +73,17 @@ class DataSetBase:
         if self.n > 500:
             data_path = f"redundancy-{self.name}.pkl"
             if os.path.exists(data_path):
-                return pickle.load(open(data_path, "rb"))
+                self._redundancy = pickle.load(open(data_path, "rb"))
             else:
                 print("Calculating redundancy data...")
-                data = self.calc_redundancy()
+                self._redundancy = self.calc_redundancy()
                 print("Storing redundancy data")
                 with open(data_path, "wb") as f:
-                    pickle.dump(data, f)
-                return data
+                    pickle.dump(self._redundancy, f)
         else:
-            return self.calc_redundancy()
+            self._redundancy = self.calc_redundancy()
+
+        return self._redundancy
 
     def get_selected_features(self, X_new):
         """Post-processes result from plug-in to return features
@@ -157,7 +174,9 @@ class Titanic(DataSetBase):
         self.default_k = 8
 
         self.n = np.size(self.X, 1)
+        self.feature_names = tuple(self.X.columns)
         self.name = "titanic"
+        self.xaxis_title = "Passenger Features"
 
 
 class Scene(DataSetBase):
@@ -178,7 +197,9 @@ class Scene(DataSetBase):
         self.default_redundancy_penalty = 0.4
 
         self.n = np.size(self.X, 1)
+        self.feature_names = tuple(self.X.columns)
         self.name = "scene"
+        self.xaxis_title = "Color and Texture Features in Image"
 
 
 def DataSet(name):
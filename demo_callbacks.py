@@ -14,46 +14,130 @@
 
 from __future__ import annotations
 
-from typing import NamedTuple, Union
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
 import dash
-from dash import MATCH, ctx
+from dash import MATCH, Patch, ctx
 from dash.dependencies import Input, Output, State
 from dash.exceptions import PreventUpdate
-import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 
 from data import DataSet
 from demo_interface import generate_problem_details_table_rows
 from src.demo_enums import SolverType
-from src.utils import draw_bar_chart, draw_accuracy_bars
+from src.utils import draw_bar_chart, draw_accuracy_bars, patch_bar_chart
 
-
-@dash.callback(
-    Output({"type": "to-collapse-class", "index": MATCH}, "className"),
-    inputs=[
-        Input({"type": "collapse-trigger", "index": MATCH}, "n_clicks"),
-        State({"type": "to-collapse-class", "index": MATCH}, "className"),
-    ],
-    prevent_initial_call=True,
+# The output graph's subplot layout is the same for every solution, so build it once as a dict.
+_OUTPUT_FIG_LAYOUT = (
+    make_subplots(
+        rows=1,
+        cols=2,
+        column_widths=[0.80, 0.20],
+        shared_yaxes=True,
+        subplot_titles=("Selected Features", "Accuracy"),
+    )
+    .update_xaxes(title_text="Num Features", row=1, col=2)
+    .update_yaxes(title_text="Feature Relevance to Outcome", row=1, col=1)
+    .update_layout(
+        showlegend=False,
+        yaxis_range=[0, 1.1],
+        margin={"t": 30, "l": 0, "b": 0, "r": 0},
+    )
+    .to_dict()["layout"]
 )
-def toggle_left_column(collapse_trigger: int, to_collapse_class: str) -> str:
-    """Toggles a 'collapsed' class that hides and shows some aspect of the UI.
+
+# Maps the solver dropdown values to the plug-in's solver name and the SolverType.
+_SOLVERS = {
+    SolverType.CQM.value: ("cqm", SolverType.CQM),
+    SolverType.NL.value: ("nl", SolverType.NL),
+}
+
+
+@lru_cache(maxsize=4)
+def _get_dataset(name: str) -> DataSet:
+    """Returns the ``DataSet`` for the given name, loading it only on first use.
+
+    The returned object is shared between callbacks, so callbacks must treat it as read-only.
 
     Args:
-        collapse_trigger (int): The (total) number of times a collapse button has been clicked.
-        to_collapse_class (str): Current class name of the thing to collapse, 'collapsed' if not
-            visible, empty string if visible.
+        name: The name of the data set.
 
     Returns:
-        str: The new class name of the thing to collapse.
+        DataSet: The DataSet object for the given data set.
     """
+    return DataSet(name)
+
 
-    classes = to_collapse_class.split(" ") if to_collapse_class else []
-    if "collapsed" in classes:
-        classes.remove("collapsed")
-        return " ".join(classes)
-    return to_collapse_class + " collapsed" if to_collapse_class else "collapsed"
+@lru_cache(maxsize=4)
+def _input_figure(data_set: str) -> dict:
+    """Returns the input graph as a Plotly figure dict.
+
+    The figure only depends on the data set, so it is built once per data set.
+
+    Args:
+        data_set: The data set selected.
+
+    Returns:
+        dict: The Plotly figure, to be treated as read-only.
+    """
+    return draw_bar_chart(None, None, _get_dataset(data_set), False)
+
+
+def _highlight_graph(
+    graph_id: str,
+    hover_data: dict,
+    show_red: bool,
+    data_set: str,
+    last_hover_feature: Optional[int],
+) -> tuple[Patch, Optional[int]]:
+    """Shared body of the callbacks that draw redundancy on top of a feature relevance bar graph.
+
+    Args:
+        graph_id: The id of the graph being highlighted.
+        hover_data: Input information about user mouse location.
+        show_red: If we want to see redundancy.
+        data_set: The data set selected.
+        last_hover_feature: The index of the feature the current figure was drawn for.
+
+    Returns:
+        Patch: A partial update of the graph figure.
+        Optional[int]: The index of the hovered feature, None if no feature is hovered.
+    """
+
+    if ctx.triggered_id == graph_id and not show_red:
+        raise PreventUpdate
+
+    hover_index = hover_data["points"][0]["pointIndex"] if hover_data and show_red else None
+
+    # Hover events are sent for every mouse movement, skip those that stay on the same feature.
+    if ctx.triggered_id == graph_id and hover_index == last_hover_feature:
+        raise PreventUpdate
+
+    # Load the data set
+    data = _get_dataset(data_set)
+
+    return patch_bar_chart(hover_data, data, show_red), hover_index
+
+
+# Toggles a 'collapsed' class that hides and shows some aspect of the UI. This runs in the
+# browser as it only needs to add or remove the 'collapsed' class of the thing to collapse.
+dash.clientside_callback(
+    """
+    function(collapseTrigger, toCollapseClass) {
+        const classes = (toCollapseClass || "").split(" ").filter(Boolean);
+        const expanded = classes.filter((className) => className !== "collapsed");
+        if (expanded.length === classes.length) {
+            expanded.push("collapsed");
+        }
+        return expanded.join(" ");
+    }
+    """,
+    Output({"type": "to-collapse-class", "index": MATCH}, "className"),
+    Input({"type": "collapse-trigger", "index": MATCH}, "n_clicks"),
+    State({"type": "to-collapse-class", "index": MATCH}, "className"),
+    prevent_initial_call=True,
+)
 
 
 @dash.callback(
@@ -76,7 +160,7 @@ def create_features_input(data_set: str) -> tuple[int, int, dict]:
         int: The default value for the number of features slider.
         dict: The marks for the slider to display min/max values.
     """
-    data = DataSet(data_set)
+    data = _get_dataset(data_set)
     max_feat = data.n
 
     value = round(max_feat / 2)
@@ -91,98 +175,133 @@ def create_features_input(data_set: str) -> tuple[int, int, dict]:
 
 @dash.callback(
     Output("input-graph", "figure"),
+    Output("last-hover-feature", "data"),
     inputs=[
-        Input("input-graph", "hoverData"),
         Input("dataset", "value"),
-        Input("input-redund", "value"),
     ],
 )
-def draw_input_graph(hover_data: dict, data_set: str, show_red: bool) -> go.Figure:
+def draw_input_graph(data_set: str) -> tuple[dict, None]:
     """Runs on load and any time the data set is updated. Displays the features in the data, with
-    a bar showing the relevance of each feature. If show_red is true, then hovering on each
-    feature's column shows the correlation between that feature and every other feature.
+    a bar showing the relevance of each feature. Redundancy is drawn on top of this figure by
+    ``highlight_input_graph``.
 
     Args:
-        hover_data: Input information about user mouse location.
         data_set: The data set selected.
-        show_red: If we want to see redundancy.
 
     Returns:
-        go.Figure: A Plotly figure object.
+        dict: The Plotly figure.
+        None: Resets the hovered feature, as the new figure shows no redundancy.
     """
 
-    if ctx.triggered_id == "input-graph" and not show_red:
-        raise PreventUpdate
+    return _input_figure(data_set), None
 
-    # Load the data set
-    data = DataSet(data_set)
 
-    return draw_bar_chart(hover_data, None, data, show_red)
+@dash.callback(
+    Output("input-graph", "figure", allow_duplicate=True),
+    Output("last-hover-feature", "data", allow_duplicate=True),
+    inputs=[
+        Input("input-graph", "hoverData"),
+        Input("input-redund", "value"),
+        State("dataset", "value"),
+        State("last-hover-feature", "data"),
+    ],
+    prevent_initial_call=True,
+)
+def highlight_input_graph(
+    hover_data: dict, show_red: bool, data_set: str, last_hover_feature: Optional[int]
+) -> tuple[Patch, Optional[int]]:
+    """Runs when hovering over the "Input" bar graph or toggling redundancy. If show_red is true,
+    hovering on each feature's column shows the correlation between that feature and every other
+    feature, updating only the bar colors and text of the figure.
+
+    Args:
+        hover_data: Input information about user mouse location.
+        show_red: If we want to see redundancy.
+        data_set: The data set selected.
+        last_hover_feature: The index of the feature the current figure was drawn for.
+
+    Returns:
+        Patch: A partial update of the input graph figure.
+        Optional[int]: The index of the hovered feature, None if no feature is hovered.
+    """
+
+    return _highlight_graph("input-graph", hover_data, show_red, data_set, last_hover_feature)
 
 
 @dash.callback(
     Output("output-graph", "figure"),
+    Output("last-results-hover-feature", "data"),
     inputs=[
-        Input("output-graph", "hoverData"),
-        Input("results-redund", "value"),
         Input("selected-features", "data"),
         Input("soln-score", "data"),
         State("dataset", "value"),
     ],
 )
 def draw_output_graph(
-    hover_data: dict, show_red: bool, selected_features: list, soln_score: float, data_set: str
-) -> go.Figure:
+    selected_features: list, soln_score: float, data_set: str
+) -> tuple[dict, None]:
     """Runs when the optimization step is complete. Displays the same bar graph as on the "Input"
     tab, with selected features solid/heavily outlined and unselected features semi-transparent.
+    Redundancy is drawn on top of this figure by ``highlight_output_graph``.
 
     Args:
-        hover_data: Input information about user mouse location.
-        show_red: If we want to see redundancy.
         selected_features: The features selected for the model.
         soln_score: The accuracy score for the model using the selected features.
         data_set: The data set selected.
 
     Returns:
-        go.Figure: A Plotly figure object.
+        dict: A Plotly figure.
+        None: Resets the hovered feature, as the new figure shows no redundancy.
     """
 
-    if ctx.triggered_id == "output-graph" and not show_red:
-        raise PreventUpdate
-
     # Load the data set
-    data = DataSet(data_set)
+    data = _get_dataset(data_set)
 
-    fig = make_subplots(
-        rows=1,
-        cols=2,
-        column_widths=[0.80, 0.20],
-        shared_yaxes=True,
-        subplot_titles=("Selected Features", "Accuracy"),
+    fig1 = draw_bar_chart(None, selected_features, data, False)
+    fig2 = draw_accuracy_bars(data, selected_features, soln_score)
+
+    # Place the accuracy bars in the second subplot and label the bar chart's x-axis.
+    fig = dict(
+        data=[fig1["data"][0], dict(fig2["data"][0], xaxis="x2", yaxis="y2")],
+        layout=dict(
+            _OUTPUT_FIG_LAYOUT,
+            xaxis=dict(_OUTPUT_FIG_LAYOUT["xaxis"], title=dict(text=data.xaxis_title)),
+        ),
     )
 
-    fig1 = draw_bar_chart(hover_data, selected_features, data, show_red)
-    fig2 = draw_accuracy_bars(data, selected_features, soln_score)
+    return fig, None
 
-    fig.add_trace(fig1["data"][0], row=1, col=1)
-    fig.add_trace(fig2["data"][0], row=1, col=2)
 
-    fig.update_xaxes(title_text="Num Features", row=1, col=2)
+@dash.callback(
+    Output("output-graph", "figure", allow_duplicate=True),
+    Output("last-results-hover-feature", "data", allow_duplicate=True),
+    inputs=[
+        Input("output-graph", "hoverData"),
+        Input("results-redund", "value"),
+        State("dataset", "value"),
+        State("last-results-hover-feature", "data"),
+    ],
+    prevent_initial_call=True,
+)
+def highlight_output_graph(
+    hover_data: dict, show_red: bool, data_set: str, last_hover_feature: Optional[int]
+) -> tuple[Patch, Optional[int]]:
+    """Runs when hovering over the "Results" bar graph or toggling redundancy. If show_red is
+    true, recolors the bars to show the correlation between the hovered feature and every other
+    feature, updating only the bar colors and text of the figure.
 
-    # Modify bar chart axis labels:
-    fig.update_yaxes(title_text="Feature Relevance to Outcome", row=1, col=1)
-    if data.name == "titanic":
-        fig.update_xaxes(title_text="Passenger Features", row=1, col=1)
-    elif data.name == "scene":
-        fig.update_xaxes(title_text="Color and Texture Features in Image", row=1, col=1)
+    Args:
+        hover_data: Input information about user mouse location.
+        show_red: If we want to see redundancy.
+        data_set: The data set selected.
+        last_hover_feature: The index of the feature the current figure was drawn for.
 
-    fig.update_layout(
-        showlegend=False,
-        yaxis_range=[0, 1.1],
-        margin={"t": 30, "l": 0, "b": 0, "r": 0},
-    )
+    Returns:
+        Patch: A partial update of the output graph figure.
+        Optional[int]: The index of the hovered feature, None if no feature is hovered.
+    """
 
-    return fig
+    return _highlight_graph("output-graph", hover_data, show_red, data_set, last_hover_feature)
 
 
 class RunOptimizationReturn(NamedTuple):
@@ -226,7 +345,7 @@ def run_optimization(
     # The parameters below must match the `Input` and `State` variables found
     # in the `inputs` list above.
     run_click: int,
-    solver_type: Union[SolverType, int],
+    solver_type: int,
     time_limit: float,
     num_features: int,
     redund_penalty: float,
@@ -258,16 +377,19 @@ def run_optimization(
 
     print("solving...")
 
-    solver_type = SolverType(solver_type)
-    solver = "cqm" if solver_type is SolverType.CQM else "nl"
+    solver, solver_type = _SOLVERS[solver_type]
 
-    data = DataSet(data_set)
+    # Background callbacks run in a new process, so the data set is always loaded from scratch
+    # here and the in-process cache of ``_get_dataset`` is never hit.
+    data = _get_dataset(data_set)
 
-    solution = data.solve_feature_selection(num_features, 1.0 - redund_penalty, time_limit, solver)
+    raw_solution = data.solve_feature_selection(
+        num_features, 1.0 - redund_penalty, time_limit, solver
+    )
+    score = data.score_indices_cv(raw_solution)
 
-    solution = [int(i) for i in solution]  # Avoid issues with json and int64
+    solution = [int(i) for i in raw_solution]  # Avoid issues with json and int64
     print("solution:", solution)
-    score = data.score_indices_cv(solution)
 
     # Generates a list of table rows for the problem details table.
     problem_details_table = generate_problem_details_table_rows(
@@ -22,6 +22,8 @@ THEME_COLOR_SECONDARY = "#2A7DE1"  # D-Wave blue default #2A7DE1
 COLOR_SCALE = ["#074C91", "#2A7DE1", "#17BEBB", "#FFA143", "#F37820"]
 
 GRAPH_FONT_SIZE = 14
+# Data sets with more features than this are drawn with WebGL markers rather than SVG bars
+WEBGL_FEATURE_THRESHOLD = 1000
 
 THUMBNAIL = "static/dwave_logo.svg"
 
@@ -15,6 +15,8 @@
 """This file stores the Dash HTML layout for the app."""
 from __future__ import annotations
 
+from functools import cache
+
 from dash import dcc, html
 
 from demo_configs import (
@@ -30,6 +32,11 @@ from demo_configs import (
 )
 from src.demo_enums import SolverType
 
+_SOLVER_OPTIONS = sorted(
+    [{"label": solver_type.label, "value": solver_type.value} for solver_type in SolverType],
+    key=lambda op: op["value"],
+)
+
 
 def slider(label: str, id: str, config: dict) -> html.Div:
     """Slider element for value selection.
@@ -112,6 +119,7 @@ def checklist(
     )
 
 
+@cache
 def generate_settings_form() -> html.Div:
     """This function generates settings for selecting the scenario, model, and solver.
 
@@ -119,10 +127,6 @@ def generate_settings_form() -> html.Div:
         html.Div: A Div containing the settings for selecting the scenario, model, and solver.
     """
 
-    solver_options = [
-        {"label": solver_type.label, "value": solver_type.value} for solver_type in SolverType
-    ]
-
     return html.Div(
         className="settings",
         children=[
@@ -144,7 +148,7 @@ def generate_settings_form() -> html.Div:
             dropdown(
                 "Solver",
                 "solver-type-select",
-                sorted(solver_options, key=lambda op: op["value"]),
+                _SOLVER_OPTIONS,
             ),
             html.Label("Solver Time Limit (seconds)"),
             dcc.Input(
@@ -156,6 +160,7 @@ def generate_settings_form() -> html.Div:
     )
 
 
+@cache
 def generate_run_buttons() -> html.Div:
     """Run and cancel buttons to run the optimization."""
     return html.Div(
@@ -191,6 +196,7 @@ def generate_problem_details_table_rows(solver: str, time_limit: int) -> list[ht
     return [html.Tr([html.Td(cell) for cell in row]) for row in table_rows]
 
 
+@cache
 def problem_details(index: int) -> html.Div:
     """Generate the problem details section.
 
@@ -247,8 +253,13 @@ def problem_details(index: int) -> html.Div:
     )
 
 
+@cache
 def create_interface():
-    """Set the application HTML."""
+    """Set the application HTML.
+
+    The layout only depends on module constants, so it is built once and the same component tree
+    is returned on later calls. The returned tree must not be mutated.
+    """
     return html.Div(
         id="app-container",
         children=[
@@ -256,6 +267,8 @@ def create_interface():
             dcc.Store(id="run-in-progress", data=False),  # Indicates whether run is in progress
             dcc.Store(id="selected-features", data=[]),
             dcc.Store(id="soln-score", data=0.0),
+            dcc.Store(id="last-hover-feature"),  # Index of the feature the input graph shows
+            dcc.Store(id="last-results-hover-feature"),  # Same for the results graph
             # Header brand banner
             html.Div(className="banner", children=[html.Img(src=THUMBNAIL)]),
             # Settings and results columns
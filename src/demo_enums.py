@@ -25,10 +25,13 @@ class SolverType(Enum):
 
     @property
     def label(self):
-        return {
-            SolverType.CQM: "Quantum Hybrid (CQM)",
-            SolverType.NL: "Quantum Hybrid (NL)",
-        }[self]
+        return _SOLVER_TYPE_LABELS[self]
+
+
+_SOLVER_TYPE_LABELS = {
+    SolverType.CQM: "Quantum Hybrid (CQM)",
+    SolverType.NL: "Quantum Hybrid (NL)",
+}
 
 
 ### If any settings or variables are being used repeatedly, thoughout the code, create a new
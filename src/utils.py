@@ -12,19 +12,153 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+from functools import lru_cache
+
+from dash import Patch
 import numpy as np
-import pandas as pd
-from plotly.colors import sample_colorscale
-import plotly.graph_objs as go
-from typing import Optional
+from plotly.colors import hex_to_rgb
+import plotly.io as pio
+from typing import Optional, Union
 
 from data import DataSet
-from demo_configs import COLOR_SCALE, GRAPH_FONT_SIZE
+from demo_configs import COLOR_SCALE, GRAPH_FONT_SIZE, WEBGL_FEATURE_THRESHOLD
+
+# Lookup table of COLOR_SCALE sampled at evenly spaced positions, built once so that coloring the
+# bars is a single array index rather than an interpolation per hover.
+_COLOR_SCALE_LUT_SIZE = 256
+_COLOR_SCALE_LUT = np.rint(
+    np.column_stack(
+        [
+            np.interp(
+                np.linspace(0, 1, _COLOR_SCALE_LUT_SIZE),
+                np.linspace(0, 1, len(COLOR_SCALE)),
+                channel,
+            )
+            for channel in np.array([hex_to_rgb(color) for color in COLOR_SCALE]).T
+        ]
+    )
+).astype(int)
+
+
+# Bar color used when not showing redundancy, and the opacity of features not in a solution.
+_BAR_COLOR = "rgb(42, 125, 225)"
+_UNSELECTED_OPACITY = 0.3
+
+
+# The figures are built as plain dicts, which skips the validation of every property that
+# go.Figure does. Plotly only applies its default template to go.Figure, so it is added explicitly.
+_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+# Styling that is the same for every chart, only the data and x-axis title of the feature
+# relevance bar chart depend on the data set.
+_BAR_CHART_LAYOUT = dict(
+    font=dict(size=GRAPH_FONT_SIZE),
+    margin={"t": 0, "l": 0, "b": 0, "r": 0},
+    yaxis=dict(title=dict(text="Feature Relevance to Outcome"), range=[0, 1.1]),
+    template=_TEMPLATE,
+)
+_ACCURACY_BARS_MARKER = dict(
+    color=[COLOR_SCALE[1], COLOR_SCALE[-1]], line=dict(color="black", width=1)
+)
+_ACCURACY_BARS_LAYOUT = dict(
+    font=dict(size=GRAPH_FONT_SIZE),
+    margin={"t": 0, "l": 0, "b": 0, "r": 0},
+    xaxis=dict(title=dict(text="Num Features")),
+    yaxis=dict(range=[0, 1.1]),
+    template=_TEMPLATE,
+)
+
+
+def to_typed_array(values: np.ndarray) -> dict:
+    """Encodes a numeric array as a Plotly typed array, which is sent to the browser as base64
+    encoded bytes rather than a JSON list of numbers.
+
+    Args:
+        values: The array to encode, with a dtype supported by Plotly (e.g. float32 or uint8).
+
+    Returns:
+        dict: The typed array specification accepted by Plotly in place of an array.
+    """
+    values = np.ascontiguousarray(values)
+    return {"dtype": values.dtype.str[1:], "bdata": base64.b64encode(values).decode("ascii")}
+
+
+@lru_cache(maxsize=4)
+def get_color_scale_indices(data: DataSet) -> np.ndarray:
+    """Maps each row of the redundancy matrix onto the color scale lookup table, from the first
+    color for the smallest value in the row to the last color for the largest value.
+
+    The mapping is computed once per data set so that hovering over a feature only has to select
+    a row of the result.
+
+    Args:
+        data: The DataSet object for the given data set.
+
+    Returns:
+        np.ndarray: An ``n`` by ``n`` uint8 matrix of the index of each value's color in the
+        lookup table.
+    """
+    redundancy = data.get_redundancy()
+    min_values = redundancy.min(axis=1, keepdims=True)
+    value_ranges = redundancy.max(axis=1, keepdims=True) - min_values
+
+    # Rows with all values equal are only filled to avoid dividing by zero, get_bar_colors draws
+    # them with the default color so these indices are never displayed.
+    varying = value_ranges[:, 0] > 0
+    indices = np.full(redundancy.shape, _COLOR_SCALE_LUT_SIZE // 2, dtype=np.uint8)
+
+    # Normalizing, scaling to the table size and rounding are folded into a single pass.
+    scales = (_COLOR_SCALE_LUT_SIZE - 1) / value_ranges[varying]
+    indices[varying] = (redundancy[varying] - min_values[varying]) * scales + 0.5
+
+    return indices
+
+
+def get_bar_colors(
+    hover_data: dict, data: DataSet, show_redundancy: bool
+) -> tuple[Union[list, str], list]:
+    """Calculates the bar colors and text for the feature relevance bar charts.
+
+    Args:
+        hover_data: Input information about user mouse location.
+        data: The DataSet object for the given data set.
+        show_redundancy: Whether we want to see redundancy.
+
+    Returns:
+        Union[list, str]: The rgb color of each bar, or a single color for all bars.
+        list: The text to display above each bar.
+    """
+
+    # Calculate the statistics if showing redundancy
+    display_text = []
+
+    hover_idx = hover_data["points"][0]["pointIndex"] if hover_data and show_redundancy else None
+
+    # Protect against case where the last hovered point was from a larger data set.
+    if hover_idx is not None and hover_idx >= data.n:
+        hover_idx = None
+
+    redundancy = data.get_redundancy()[hover_idx] if hover_idx is not None else None
+
+    # Manually calculate the continuous color map to show redundancy. A row whose values are all
+    # equal, or undefined for a constant feature, has nothing to show so keeps the default color.
+    if redundancy is not None and np.ptp(redundancy) > 0:
+        rgb_colors = _COLOR_SCALE_LUT[get_color_scale_indices(data)[hover_idx]].tolist()
+        colors = [f"rgb({r}, {g}, {b})" for r, g, b in rgb_colors]
+
+        if data.n < 30:
+            display_text = np.char.mod("%.2f", redundancy).tolist()
+    else:
+        # All bars share one color, which Plotly applies to every bar.
+        colors = _BAR_COLOR
+
+    return colors, display_text
 
 
 def draw_bar_chart(
     hover_data: dict, selected_features: Optional[list], data: DataSet, show_redundancy: bool
-) -> go.Figure:
+) -> dict:
     """Draws the feature relevance bar charts for input/output.
 
     Args:
@@ -34,99 +168,80 @@ def draw_bar_chart(
         show_redundancy: Whether we want to see redundancy.
 
     Returns:
-        go.Figure: A Plotly figure object showing the relevance of each feature.
+        dict: A Plotly figure showing the relevance of each feature.
 
     """
 
-    df = pd.DataFrame(
-        {
-            "Feature": data.X.columns,
-            "Feature Relevance": data.get_relevance(),
-        }
-    )
-
-    # Calculate the statistics if showing redundancy
-    display_text = []
-    hover_cols = {"Feature Relevance": False}
+    colors, display_text = get_bar_colors(hover_data, data, show_redundancy)
 
     # When displaying a solution, show selected feature as solid and non-selected
     # features as transparent
+    opacity = 1.0
+    mlw = 1 if data.n < 50 else 0
     if selected_features:
-        opacity = np.repeat(0.3, len(df))
-    else:
-        opacity = np.repeat(1.0, len(df))
-        selected_features = []
-    opacity[selected_features] = 1.0
-
-    mlw = np.repeat(1 if data.n < 50 else 0, len(df))
-    if data.n < 50:
-        mlw[selected_features] = 3
-
-    # Manually calculate the continuous color map to show redundancy.
-    # This is required for different opacity levels per bar.
-    if hover_data and show_redundancy:
-        idx = hover_data["points"][0]["pointIndex"]
-        redundancy_data = data.get_redundancy()
-        # Protect against case where the last hovered point was from a larger data set.
-        if idx < data.n:
-            # Note: this modifies global data and so is not compatible with use
-            # of the demo in a multi-user environment.  One alternative is to
-            # make a copy of the DataFrame prior to modifying the redundancy
-            # column.
-            df["Redundancy"] = redundancy_data[idx]
-            hover_cols["Redundancy"] = False
-
-        color_data = df["Redundancy"].values
-        normalized_color_data = (color_data - np.min(color_data)) / (
-            np.max(color_data) - np.min(color_data)
-        )
-        rgba_colors = sample_colorscale(COLOR_SCALE, normalized_color_data, colortype="rgb")
+        is_selected = np.zeros(data.n, dtype=bool)
+        is_selected[selected_features] = True
+        opacity = to_typed_array(np.where(is_selected, 1.0, _UNSELECTED_OPACITY))
+        if data.n < 50:
+            mlw = to_typed_array(np.where(is_selected, 3, 1).astype(np.uint8))
 
-        for i in range(len(rgba_colors)):
-            rgba_colors[i] = "rgba" + rgba_colors[i][3:-1] + ", " + str(opacity[i]) + ")"
+    relevance = to_typed_array(data.get_relevance())
+    marker = dict(color=colors, opacity=opacity, line=dict(color="black", width=mlw))
 
-        if data.n < 30:
-            display_text = [round(i.item(), 2) for i in color_data]
+    if data.n > WEBGL_FEATURE_THRESHOLD:
+        # SVG bars are slow to render for many features, so draw WebGL markers instead. The
+        # markers take the bar colors and opacity, so redundancy and solutions show the same way.
+        bars = dict(
+            type="scattergl",
+            x=data.feature_names,
+            y=relevance,
+            mode="markers",
+            marker=marker,
+            hoverinfo="none",
+        )
     else:
-        rgba_colors = [f"rgba(42, 125, 225, {o})" for o in opacity]
+        # Plot the bar graph
+        bars = dict(
+            type="bar",
+            x=data.feature_names,
+            y=relevance,
+            text=display_text,
+            textposition="outside",
+            marker=marker,
+            hoverinfo="none",
+        )
 
-    # Plot the bar graph
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df["Feature"],
-                y=df["Feature Relevance"],
-                text=display_text,
-                textposition="outside",
-            )
-        ]
+    return dict(
+        data=[bars],
+        layout=dict(**_BAR_CHART_LAYOUT, xaxis=dict(title=dict(text=data.xaxis_title))),
     )
 
-    fig.update_traces(
-        marker_color=rgba_colors,
-        marker_line_color="black",
-        marker_line_width=mlw,
-        hoverinfo="none",
-        hovertemplate=None,
-    )
 
-    fig.update_layout(
-        font=dict(size=GRAPH_FONT_SIZE),
-        margin={"t": 0, "l": 0, "b": 0, "r": 0},
-        yaxis_title="Feature Relevance to Outcome",
-        yaxis_range=[0, 1.1],
-    )
+def patch_bar_chart(hover_data: dict, data: DataSet, show_redundancy: bool) -> Patch:
+    """Updates the colors and text of a feature relevance bar chart drawn by ``draw_bar_chart``
+    without resending the rest of the figure. The opacity of selected features is left unchanged.
+
+    Args:
+        hover_data: Input information about user mouse location.
+        data: The DataSet object for the given data set.
+        show_redundancy: Whether we want to see redundancy.
 
-    # Modify axis labels:
-    if data.name == "titanic":
-        fig.update_layout(xaxis_title="Passenger Features")
-    elif data.name == "scene":
-        fig.update_layout(xaxis_title="Color and Texture Features in Image")
+    Returns:
+        Patch: A partial update of the figure whose first trace is the bar chart.
+    """
+
+    colors, display_text = get_bar_colors(hover_data, data, show_redundancy)
 
-    return fig
+    patched_figure = Patch()
+    patched_figure["data"][0]["marker"]["color"] = colors
+    # Bar text is only displayed for small data sets, for larger ones it never changes.
+    if data.n < 30:
+        patched_figure["data"][0]["text"] = display_text
 
+    return patched_figure
 
-def draw_accuracy_bars(data: DataSet, selected_features: list, soln_score: float) -> go.Figure:
+
+def draw_accuracy_bars(data: DataSet, selected_features: list, soln_score: float) -> dict:
     """Draws the accuracy bar chart for output.
 
     Args:
@@ -135,37 +250,24 @@ def draw_accuracy_bars(data: DataSet, selected_features: list, soln_score: float
         soln_score: Accuracy score for model using selected_features.
 
     Returns:
-        go.Figure: A Plotly figure object comparing the accuracy of using all features vs only the
-        selected features.
+        dict: A Plotly figure comparing the accuracy of using all features vs only the selected
+        features.
 
     """
 
     scores = [round(data.baseline_cv_score, 2), round(soln_score, 2)]
 
-    fig = go.Figure(
+    return dict(
         data=[
-            go.Bar(
+            dict(
+                type="bar",
                 x=[str(data.n), str(len(selected_features))],
                 y=scores,
                 text=scores,
                 textposition="outside",
+                marker=_ACCURACY_BARS_MARKER,
+                hoverinfo="none",
             )
-        ]
+        ],
+        layout=_ACCURACY_BARS_LAYOUT,
     )
-
-    fig.update_traces(
-        marker_color=[COLOR_SCALE[1], COLOR_SCALE[-1]],
-        marker_line_color="black",
-        marker_line_width=1,
-        hoverinfo="none",
-        hovertemplate=None,
-    )
-
-    fig.update_layout(
-        font=dict(size=GRAPH_FONT_SIZE),
-        margin={"t": 0, "l": 0, "b": 0, "r": 0},
-        xaxis_title="Num Features",
-        yaxis_range=[0, 1.1],
-    )
-
-    return fig
@@ -31,18 +31,24 @@ class TestData(unittest.TestCase):
     @patch("data.DataSetBase.get_selected_features")
     def test_titanic_class(self, solver, mock_get, mock_select):
         titanic = data.Titanic()
+        self.assertEqual(titanic.feature_names, tuple(titanic.X.columns))
+
         relevance = titanic.get_relevance()
 
         self.assertEqual(len(relevance), titanic.n)
+        self.assertIs(titanic.get_relevance(), relevance)
+        self.assertEqual(relevance.dtype, np.float32)
         for value in relevance:
             self.assertGreaterEqual(value, 0)
             self.assertLessEqual(value, 1.0)
 
         redundancy = titanic.calc_redundancy()
         self.assertEqual(redundancy.shape, (titanic.n, titanic.n))
+        self.assertEqual(redundancy.dtype, np.float32)
 
         from_get_redundancy = titanic.get_redundancy()
         self.assertTrue(np.array_equal(redundancy, from_get_redundancy))
+        self.assertIs(titanic.get_redundancy(), from_get_redundancy)
 
         titanic.solve_feature_selection(k=3, alpha=0.5, time=10, solver=solver)
         mock_select.assert_called_with(num_features=3, alpha=0.5, time_limit=10, solver=solver)
@@ -70,18 +76,24 @@ class TestData(unittest.TestCase):
     @patch("data.DataSetBase.get_selected_features")
     def test_scene_class(self, solver, mock_get, mock_select):
         scene = data.Scene()
+        self.assertEqual(scene.feature_names, tuple(scene.X.columns))
+
         relevance = scene.get_relevance()
 
         self.assertEqual(len(relevance), scene.n)
+        self.assertIs(scene.get_relevance(), relevance)
+        self.assertEqual(relevance.dtype, np.float32)
         for value in relevance:
             self.assertGreaterEqual(value, 0)
             self.assertLessEqual(value, 1.0)
 
         redundancy = scene.calc_redundancy()
         self.assertEqual(redundancy.shape, (scene.n, scene.n))
+        self.assertEqual(redundancy.dtype, np.float32)
 
         from_get_redundancy = scene.get_redundancy()
         self.assertTrue(np.array_equal(redundancy, from_get_redundancy))
+        self.assertIs(scene.get_redundancy(), from_get_redundancy)
 
         scene.solve_feature_selection(k=3, alpha=0.5, time=10, solver=solver)
         mock_select.assert_called_with(num_features=3, alpha=0.5, time_limit=10, solver=solver)
@@ -0,0 +1,135 @@
+# Copyright 2025 D-Wave
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import numpy as np
+import pandas as pd
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+import data
+from src import utils
+
+
+class RandomData(data.DataSetBase):
+    """Data set of random features, used for data sets larger than the bundled ones."""
+
+    def __init__(self, n):
+        rng = np.random.default_rng(0)
+        self.X = pd.DataFrame(rng.random((20, n)))
+        self.y = rng.integers(0, 2, 20)
+        self.n = n
+        self.feature_names = tuple(self.X.columns)
+        self.name = "random"
+        self.xaxis_title = "Random Features"
+
+
+class TestUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.titanic = data.Titanic()
+        self.hover_data = {"points": [{"pointIndex": 2}]}
+
+    @patch("src.utils.WEBGL_FEATURE_THRESHOLD", 5)
+    def test_draw_bar_chart_webgl(self):
+        fig = utils.draw_bar_chart(self.hover_data, [1, 2], self.titanic, True)
+        trace = fig["data"][0]
+
+        self.assertEqual(trace["type"], "scattergl")
+        self.assertEqual(trace["mode"], "markers")
+        self.assertNotIn("error_y", trace)
+        self.assertEqual(len(trace["marker"]["color"]), self.titanic.n)
+
+        opacity = trace["marker"]["opacity"]
+        self.assertEqual(opacity["dtype"], "f8")
+        opacity = np.frombuffer(base64.b64decode(opacity["bdata"]), dtype=np.float64)
+        self.assertEqual(opacity.tolist()[:4], [0.3, 1.0, 1.0, 0.3])
+
+        patched_figure = utils.patch_bar_chart(self.hover_data, self.titanic, True)
+        operations = patched_figure.to_plotly_json()["operations"]
+
+        self.assertEqual(operations[0]["location"], ["data", 0, "marker", "color"])
+        self.assertEqual(operations[0]["params"]["value"], trace["marker"]["color"])
+
+    def test_get_color_scale_indices(self):
+        redundancy = self.titanic.get_redundancy()
+        indices = utils.get_color_scale_indices(self.titanic)
+
+        self.assertEqual(indices.shape, (self.titanic.n, self.titanic.n))
+        self.assertEqual(indices.dtype, np.uint8)
+        self.assertIs(utils.get_color_scale_indices(self.titanic), indices)
+        for row, row_indices in zip(redundancy, indices):
+            self.assertEqual(row_indices[np.argmin(row)], 0)
+            self.assertEqual(row_indices[np.argmax(row)], 255)
+
+    def test_get_bar_colors(self):
+        colors, display_text = utils.get_bar_colors(self.hover_data, self.titanic, True)
+        indices = utils.get_color_scale_indices(self.titanic)[2]
+
+        self.assertEqual(len(colors), self.titanic.n)
+        first_color, last_color = utils._COLOR_SCALE_LUT[[0, -1]].tolist()
+        self.assertEqual(colors[np.argmin(indices)], "rgb({}, {}, {})".format(*first_color))
+        self.assertEqual(colors[np.argmax(indices)], "rgb({}, {}, {})".format(*last_color))
+        self.assertEqual(display_text[2], "1.00")
+
+        # Without redundancy all bars share the default color
+        self.assertEqual(
+            utils.get_bar_colors(self.hover_data, self.titanic, False), (utils._BAR_COLOR, [])
+        )
+        self.assertEqual(utils.get_bar_colors(None, self.titanic, True), (utils._BAR_COLOR, []))
+
+    def test_get_bar_colors_out_of_range(self):
+        # The last hovered feature can be from a larger data set
+        hover_data = {"points": [{"pointIndex": self.titanic.n}]}
+
+        self.assertEqual(
+            utils.get_bar_colors(hover_data, self.titanic, True), (utils._BAR_COLOR, [])
+        )
+
+    @parameterized.expand(
+        [
+            ("constant", 0.5),
+            ("nan", np.nan),
+        ]
+    )
+    def test_get_bar_colors_constant_row(self, name, value):
+        redundancy = self.titanic.get_redundancy().copy()
+        redundancy[2] = value
+        self.titanic._redundancy = redundancy
+
+        self.assertEqual(
+            utils.get_bar_colors(self.hover_data, self.titanic, True), (utils._BAR_COLOR, [])
+        )
+
+    def test_patch_bar_chart(self):
+        patched_figure = utils.patch_bar_chart(self.hover_data, self.titanic, True)
+        operations = patched_figure.to_plotly_json()["operations"]
+        colors, display_text = utils.get_bar_colors(self.hover_data, self.titanic, True)
+
+        self.assertEqual(
+            [(op["operation"], op["location"], op["params"]["value"]) for op in operations],
+            [
+                ("Assign", ["data", 0, "marker", "color"], colors),
+                ("Assign", ["data", 0, "text"], display_text),
+            ],
+        )
+
+        # Bar text is never displayed for larger data sets, so it is not patched
+        large_data = RandomData(30)
+        patched_figure = utils.patch_bar_chart(self.hover_data, large_data, True)
+        operations = patched_figure.to_plotly_json()["operations"]
+
+        self.assertEqual(len(operations), 1)
+        self.assertEqual(operations[0]["location"], ["data", 0, "marker", "color"])
+        self.assertEqual(len(operations[0]["params"]["value"]), large_data.n)